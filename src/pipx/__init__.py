@@ -1,4 +1,4 @@
 import sys
 
-if sys.version_info < (3, 8, 0):
+if sys.hexversion < 0x03080000:
     sys.exit("Python 3.8 or later is required. See https://github.com/pypa/pipx for installation instructions.")
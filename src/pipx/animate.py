@@ -7,9 +7,11 @@ from typing import Generator, List
 from pipx.constants import WINDOWS
 from pipx.emojis import EMOJI_SUPPORT
 
-stderr_is_tty = sys.stderr.isatty()
+# computed once at import; also tolerates a missing or detached stderr
+stderr_is_tty = bool(getattr(sys.stderr, "isatty", lambda: False)())
 
 CLEAR_LINE = "\033[K"
+_CLEAR_LINE_SEQ = f"\r{CLEAR_LINE}"
 EMOJI_ANIMATION_FRAMES = ["⣷", "⣯", "⣟", "⡿", "⢿", "⣻", "⣽", "⣾"]
 NONEMOJI_ANIMATION_FRAMES = ["", ".", "..", "..."]
 EMOJI_FRAME_PERIOD = 0.1
@@ -77,7 +79,11 @@ def print_animation(
     animate_at_beginning_of_line: bool,
 ) -> None:
     (term_cols, _) = shutil.get_terminal_size(fallback=(9999, 24))
+    # bind the hot stderr methods once instead of looking them up per frame
+    stderr_write = sys.stderr.write
+    stderr_flush = sys.stderr.flush
     event.wait(delay)
+    last_line = None
     while not event.wait(0):
         for s in symbols:
             if animate_at_beginning_of_line:
@@ -89,9 +95,13 @@ def print_animation(
                 max_message_len = term_cols - len("... ")
                 cur_line = f"{message:.{max_message_len}}{s}"
 
-            clear_line()
-            sys.stderr.write(cur_line)
-            sys.stderr.flush()
+            # only redraw when the frame actually changed, to avoid
+            #   needless clear/write/flush cycles on the terminal
+            if cur_line != last_line:
+                clear_line()
+                stderr_write(cur_line)
+                stderr_flush()
+                last_line = cur_line
             if event.wait(period):
                 break
 
@@ -128,5 +138,5 @@ def show_cursor() -> None:
 
 def clear_line() -> None:
     """Clears current line and positions cursor at start of line"""
-    sys.stderr.write(f"\r{CLEAR_LINE}")
-    sys.stdout.write(f"\r{CLEAR_LINE}")
+    sys.stderr.write(_CLEAR_LINE_SEQ)
+    sys.stdout.write(_CLEAR_LINE_SEQ)
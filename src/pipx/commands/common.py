@@ -362,7 +362,7 @@ def _get_list_output(
     )
     if injected_packages:
         output.append("    Injected Packages:")
-        output.extend(f"      - {name} {injected_packages[name].package_version}" for name in injected_packages)
+        output.extend(f"      - {name} {info.package_version}" for name, info in injected_packages.items())
     return "\n".join(output)
 
 
@@ -1,9 +1,10 @@
+import functools
 import logging
 import os
 import re
 import sys
 from pathlib import Path
-from typing import Generator, Iterable, List, Optional, Union
+from typing import Generator, Iterable, List, Optional, Tuple, Union
 
 from pipx import paths
 from pipx.colors import bold
@@ -18,21 +19,25 @@ logger = logging.getLogger(__name__)
 COMMENT_RE = re.compile(r"(^|\s+)#.*$")
 
 
-def inject_dep(
-    venv_dir: Path,
-    package_name: Optional[str],
-    package_spec: str,
-    pip_args: List[str],
-    *,
-    verbose: bool,
-    include_apps: bool,
-    include_dependencies: bool,
-    force: bool,
-    suffix: bool = False,
-) -> bool:
-    logger.debug("Injecting package %s", package_spec)
+@functools.lru_cache(maxsize=512)
+def _package_name_from_spec_cached(package_spec: str, python: str, pip_args: Tuple[str, ...], verbose: bool) -> str:
+    """Memoized package_name_from_spec to avoid re-resolving identical specs.
 
-    if not venv_dir.exists() or not next(venv_dir.iterdir()):
+    Resolving a non-trivial spec spawns pip in a temporary venv, so repeated
+    injections of the same spec should only pay that cost once per process.
+    """
+    return package_name_from_spec(package_spec, python, pip_args=list(pip_args), verbose=verbose)
+
+
+def venv_for_injection(venv_dir: Path, package_spec: str, *, pip_args: List[str], verbose: bool) -> Venv:
+    """Validate `venv_dir` and return the Venv that packages will be injected into."""
+    # one scandir call covers both the existence and the emptiness check
+    try:
+        with os.scandir(venv_dir) as entries:
+            venv_dir_missing_or_empty = next(entries, None) is None
+    except (FileNotFoundError, NotADirectoryError):
+        venv_dir_missing_or_empty = True
+    if venv_dir_missing_or_empty:
         raise PipxError(
             f"""
             Can't inject {package_spec!r} into nonexistent Virtual Environment
@@ -54,14 +59,31 @@ def inject_dep(
             """
         )
 
+    return venv
+
+
+def inject_dep(
+    venv: Venv,
+    package_name: Optional[str],
+    package_spec: str,
+    pip_args: List[str],
+    *,
+    verbose: bool,
+    include_apps: bool,
+    include_dependencies: bool,
+    force: bool,
+    suffix: bool = False,
+) -> bool:
+    logger.debug("Injecting package %s", package_spec)
+
     # package_spec is anything pip-installable, including package_name, vcs spec,
     #   zip file, or tar.gz file.
     if package_name is None:
-        package_name = package_name_from_spec(
+        package_name = _package_name_from_spec_cached(
             package_spec,
             os.fspath(venv.python_path),
-            pip_args=pip_args,
-            verbose=verbose,
+            tuple(pip_args),
+            verbose,
         )
 
     if not force and venv.has_package(package_name):
@@ -70,7 +92,7 @@ def inject_dep(
             pipx_wrap(
                 f"""
                 {hazard} {package_name} already seems to be injected in {venv.name!r}.
-                Not modifying existing installation in '{venv_dir}'.
+                Not modifying existing installation in '{venv.root}'.
                 Pass '--force' to force installation.
                 """
             )
@@ -96,7 +118,7 @@ def inject_dep(
             package_name,
             paths.ctx.bin_dir,
             paths.ctx.man_dir,
-            venv_dir,
+            venv.root,
             include_dependencies,
             force=force,
         )
@@ -137,10 +159,11 @@ def inject(
     # Inject packages
     if not include_apps and include_dependencies:
         include_apps = True
-    all_success = True
+    # validate the target venv and load its metadata once, not once per package
+    venv = venv_for_injection(venv_dir, packages[0], pip_args=pip_args, verbose=verbose)
     for dep in packages:
-        all_success &= inject_dep(
-            venv_dir,
+        if not inject_dep(
+            venv,
             package_name=None,
             package_spec=dep,
             pip_args=pip_args,
@@ -149,10 +172,12 @@ def inject(
             include_dependencies=include_dependencies,
             force=force,
             suffix=suffix,
-        )
+        ):
+            # Fail fast instead of spawning pip for the remaining packages
+            return EXIT_CODE_INJECT_ERROR
 
     # Any failure to install will raise PipxError, otherwise success
-    return EXIT_CODE_OK if all_success else EXIT_CODE_INJECT_ERROR
+    return EXIT_CODE_OK
 
 
 def parse_requirements(filename: Union[str, os.PathLike]) -> Generator[str, None, None]:
@@ -162,8 +187,9 @@ def parse_requirements(filename: Union[str, os.PathLike]) -> Generator[str, None
     Return all of the non-empty lines with comments removed.
     """
     # Based on https://github.com/pypa/pip/blob/main/src/pip/_internal/req/req_file.py
-    with open(filename) as f:
-        for line in f:
-            # Strip comments and filter empty lines
-            if pkgspec := COMMENT_RE.sub("", line).strip():
-                yield pkgspec
+    # Read the file in one go and split in memory; requirement files are
+    #   small, and this skips the per-line file-object iteration overhead
+    for line in Path(filename).read_text(encoding="utf-8").splitlines():
+        # Strip comments and filter empty lines
+        if pkgspec := COMMENT_RE.sub("", line).strip():
+            yield pkgspec
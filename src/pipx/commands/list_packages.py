@@ -1,6 +1,7 @@
 import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Collection, Dict, Tuple
 
@@ -67,8 +68,11 @@ def list_json(venv_dirs: Collection[Path]) -> VenvProblems:
         "venvs": {},
     }
     all_venv_problems = VenvProblems()
-    for venv_dir in venv_dirs:
-        (venv_metadata, venv_problems, warning_str) = get_venv_metadata_summary(venv_dir)
+    # collecting metadata only reads per-venv files on disk, so overlap the
+    #   I/O across venvs; executor.map preserves input order
+    with ThreadPoolExecutor(max_workers=min(32, len(venv_dirs) or 1)) as executor:
+        venv_summaries = list(executor.map(get_venv_metadata_summary, venv_dirs))
+    for venv_dir, (venv_metadata, venv_problems, warning_str) in zip(venv_dirs, venv_summaries):
         all_venv_problems.or_(venv_problems)
         if venv_problems.any_():
             warning_messages.append(warning_str)
@@ -77,7 +81,9 @@ def list_json(venv_dirs: Collection[Path]) -> VenvProblems:
         spec_metadata["venvs"][venv_dir.name] = {}
         spec_metadata["venvs"][venv_dir.name]["metadata"] = venv_metadata.to_dict()
 
-    print(json.dumps(spec_metadata, indent=4, sort_keys=True, cls=JsonEncoderHandlesPath))
+    # serialize once and emit with a single write: json.dump would issue one
+    #   stream write per token, which dominates for indented output
+    sys.stdout.write(json.dumps(spec_metadata, indent=4, sort_keys=True, cls=JsonEncoderHandlesPath) + "\n")
     for warning_message in warning_messages:
         logger.warning(warning_message)
 
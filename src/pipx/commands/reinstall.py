@@ -79,21 +79,25 @@ def reinstall(
     )
 
     # now install injected packages
-    for injected_name, injected_package in venv.pipx_metadata.injected_packages.items():
-        if injected_package.package_or_url is None:
-            # This should never happen, but package_or_url is type
-            #   Optional[str] so mypy thinks it could be None
-            raise PipxError(f"Internal Error injecting package {injected_package} into {venv.name}")
-        inject_dep(
-            venv_dir,
-            injected_name,
-            injected_package.package_or_url,
-            injected_package.pip_args,
-            verbose=verbose,
-            include_apps=injected_package.include_apps,
-            include_dependencies=injected_package.include_dependencies,
-            force=True,
-        )
+    if venv.pipx_metadata.injected_packages:
+        # the venv was just recreated by install() above, so one Venv object
+        #   can be reused for all injections
+        inject_venv = Venv(venv_dir, verbose=verbose)
+        for injected_name, injected_package in venv.pipx_metadata.injected_packages.items():
+            if injected_package.package_or_url is None:
+                # This should never happen, but package_or_url is type
+                #   Optional[str] so mypy thinks it could be None
+                raise PipxError(f"Internal Error injecting package {injected_package} into {venv.name}")
+            inject_dep(
+                inject_venv,
+                injected_name,
+                injected_package.package_or_url,
+                injected_package.pip_args,
+                verbose=verbose,
+                include_apps=injected_package.include_apps,
+                include_dependencies=injected_package.include_dependencies,
+                force=True,
+            )
 
     # Any failure to install will raise PipxError, otherwise success
     return EXIT_CODE_OK
@@ -117,8 +121,9 @@ def reinstall_all(
     # for the first one, we also trigger
     # a reinstall of shared libs beforehand
     first_reinstall = True
+    skip_set = frozenset(skip)
     for venv_dir in venv_container.iter_venv_dirs():
-        if venv_dir.name in skip:
+        if venv_dir.name in skip_set:
             continue
         try:
             reinstall(
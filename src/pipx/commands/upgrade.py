@@ -240,11 +240,16 @@ def upgrade_all(
     """Return pipx exit code."""
     failed: List[str] = []
     upgraded: List[str] = []
+    skip_set = frozenset(skip)
 
     for venv_dir in venv_container.iter_venv_dirs():
+        # filter on the name alone first, so skipped venvs never pay for
+        #   Venv construction and its metadata reads
+        if venv_dir.name in skip_set:
+            continue
         venv = Venv(venv_dir, verbose=verbose)
         venv.check_upgrade_shared_libs(pip_args=pip_args, verbose=verbose)
-        if venv_dir.name in skip or "--editable" in venv.pipx_metadata.main_package.pip_args:
+        if "--editable" in venv.pipx_metadata.main_package.pip_args:
             continue
         try:
             _upgrade_venv(
@@ -42,6 +42,32 @@ class RelevantSearch:
     category: str
 
 
+# single alternation so each pip stdout line is scanned at most once
+PIP_STDOUT_RE = re.compile(r"Failed to build\s+(?P<failed>\S.+)$|^\s*Collecting\s+(?P<collecting>\S+)")
+FAILED_BUILD_STDERR_RE = re.compile(r"Failed to build\s+(?!one or more packages)(\S+)")
+
+# In order of most useful to least useful
+RELEVANT_SEARCHES = [
+    RelevantSearch(re.compile(r"not (?:be )?found", re.I), "not_found"),
+    RelevantSearch(re.compile(r"no such", re.I), "no_such"),
+    RelevantSearch(re.compile(r"(Exception|Error):\s*\S+"), "exception_error"),
+    RelevantSearch(re.compile(r"fatal error", re.I), "fatal_error"),
+    RelevantSearch(re.compile(r"conflict", re.I), "conflict_"),
+    RelevantSearch(
+        re.compile(
+            r"error:"
+            r"(?!.+Command errored out)"
+            r"(?!.+failed building wheel for)"
+            r"(?!.+could not build wheels? for)"
+            r"(?!.+failed to build one or more wheels)"
+            r".+[^:]$",
+            re.I,
+        ),
+        "error_",
+    ),
+]
+
+
 def _get_trash_file(path: Path) -> Path:
     if not paths.ctx.trash.is_dir():
         paths.ctx.trash.mkdir()
@@ -254,44 +280,26 @@ def analyze_pip_output(pip_stdout: str, pip_stderr: str) -> None:
     # for any useful information in stdout, `pip install` must be run without
     #   the -q option
     for line in pip_stdout.split("\n"):
-        failed_match = re.search(r"Failed to build\s+(\S.+)$", line)
-        collecting_match = re.search(r"^\s*Collecting\s+(\S+)", line)
-        if failed_match:
-            failed_build_stdout = failed_match.group(1).strip().split()
-        if collecting_match:
-            last_collecting_dep = collecting_match.group(1)
-
-    # In order of most useful to least useful
-    relevant_searches = [
-        RelevantSearch(re.compile(r"not (?:be )?found", re.I), "not_found"),
-        RelevantSearch(re.compile(r"no such", re.I), "no_such"),
-        RelevantSearch(re.compile(r"(Exception|Error):\s*\S+"), "exception_error"),
-        RelevantSearch(re.compile(r"fatal error", re.I), "fatal_error"),
-        RelevantSearch(re.compile(r"conflict", re.I), "conflict_"),
-        RelevantSearch(
-            re.compile(
-                r"error:"
-                r"(?!.+Command errored out)"
-                r"(?!.+failed building wheel for)"
-                r"(?!.+could not build wheels? for)"
-                r"(?!.+failed to build one or more wheels)"
-                r".+[^:]$",
-                re.I,
-            ),
-            "error_",
-        ),
-    ]
-
-    failed_stderr_patt = re.compile(r"Failed to build\s+(?!one or more packages)(\S+)")
+        # plain substring tests are much cheaper than regex searches, so only
+        #   run the regex on lines that can possibly match
+        if "Failed to build" in line or "Collecting" in line:
+            match = PIP_STDOUT_RE.search(line)
+            if match is None:
+                continue
+            if match.group("failed") is not None:
+                failed_build_stdout = match.group("failed").strip().split()
+            elif match.group("collecting") is not None:
+                last_collecting_dep = match.group("collecting")
 
     relevants_saved = []
     failed_build_stderr = set()
     for line in pip_stderr.split("\n"):
-        failed_build_match = failed_stderr_patt.search(line)
-        if failed_build_match:
-            failed_build_stderr.add(failed_build_match.group(1))
+        if "Failed to build" in line:
+            failed_build_match = FAILED_BUILD_STDERR_RE.search(line)
+            if failed_build_match:
+                failed_build_stderr.add(failed_build_match.group(1))
 
-        for relevant_search in relevant_searches:
+        for relevant_search in RELEVANT_SEARCHES:
             if relevant_search.pattern.search(line):
                 relevants_saved.append((line.strip(), relevant_search.category))
                 break
@@ -315,7 +323,7 @@ def analyze_pip_output(pip_stdout: str, pip_stderr: str) -> None:
     if relevants_saved:
         print("\nSome possibly relevant errors from pip install:", file=sys.stderr)
 
-        print_categories = [x.category for x in relevant_searches]
+        print_categories = [x.category for x in RELEVANT_SEARCHES]
         relevants_saved_filtered = relevants_saved.copy()
         while (len(print_categories) > 1) and (len(relevants_saved_filtered) > max_relevant_errors):
             print_categories.pop(-1)
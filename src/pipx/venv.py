@@ -1,5 +1,6 @@
 import json
 import logging
+import os
 import re
 import shutil
 import time
@@ -66,12 +67,16 @@ class VenvContainer:
 
     def iter_venv_dirs(self) -> Generator[Path, None, None]:
         """Iterate venv directories in this container."""
-        if not self._root.is_dir():
+        # os.scandir reuses the directory entry's cached type information,
+        #   avoiding an extra stat syscall per entry compared to iterdir()
+        try:
+            with os.scandir(self._root) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    yield Path(entry.path)
+        except (FileNotFoundError, NotADirectoryError):
             return
-        for entry in self._root.iterdir():
-            if not entry.is_dir():
-                continue
-            yield entry
 
     def get_venv_dir(self, package_name: str) -> Path:
         """Return the expected venv path for given `package_name`."""